@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import List
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CategoryKeywords:
     """Keyword management for article categorization"""
 
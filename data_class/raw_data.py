@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class RawData:
     """
     Data class to represent raw data retreived from scraping our sources.
@@ -11,7 +11,7 @@ class RawData:
 
     title: str
     content: str
-    publish_date: str  # iso date string
+    publish_date: str | datetime  # ISO string or parsed datetime; orjson handles both
     url: str
     source: str
     type: str
@@ -19,3 +19,19 @@ class RawData:
     claim: Optional[str] = None
     verdict: Optional[str] = None
     authors: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Flat dict for serialization (no recursion or copying, unlike
+        dataclasses.asdict)"""
+        return {
+            "title": self.title,
+            "content": self.content,
+            "publish_date": self.publish_date,
+            "url": self.url,
+            "source": self.source,
+            "type": self.type,
+            "source_bias": self.source_bias,
+            "claim": self.claim,
+            "verdict": self.verdict,
+            "authors": self.authors,
+        }
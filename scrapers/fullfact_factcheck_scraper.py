@@ -1,11 +1,16 @@
 from .base import BaseScraper
-from playwright.async_api import Locator
+from .log import get_logger
+from .http_fetch import make_client, fetch_html
+from playwright.async_api import Locator, Page
+from selectolax.parser import HTMLParser
 from data_class.raw_data import RawData
-from dataclasses import asdict
 import asyncio
 import traceback
 
 
+logger = get_logger(__name__)
+
+
 class FullfactFactcheckScraper(BaseScraper):
     def __init__(self, start_page: int = 1):
         super().__init__(
@@ -16,6 +21,10 @@ class FullfactFactcheckScraper(BaseScraper):
         self.restart_interval = 5  # In pages
         self.log_clear_interval = 1  # In pages
 
+        # Fullfact articles are server-rendered; try a plain HTTP fetch
+        # first and only fall back to the browser when selectors miss
+        self._http = make_client()
+
     async def process(self) -> None:
         await self.start()
 
@@ -29,9 +38,9 @@ class FullfactFactcheckScraper(BaseScraper):
                     and curr_page != self.start_page
                 ):
                     print(
-                        f"Restarting browser at page {curr_page} for memory management"
+                        f"Recycling browser contexts at page {curr_page} for memory management"
                     )
-                    await self.restart()
+                    await self.recycle_context()
 
                 # print(f"Navigating to page {curr_page}")
                 await self.navigate_with_retry(
@@ -45,23 +54,15 @@ class FullfactFactcheckScraper(BaseScraper):
                     break
 
                 # print("Scraping through article URLs")
-                for url in urls:
-                    article_datas = await self.extract_data_from_url(url)
-
-                    for article_data in article_datas:
-                        article_data_dict = asdict(article_data)
-
-                        await self.append_to_json(article_data_dict)
-
-                    await asyncio.sleep(0.5)
+                await self.scrape_urls(urls)
 
                 curr_page += 1
                 await self.clear_logs_and_gc()
 
-        except Exception as e:
-            print(traceback.format_exc())
-            print(f"Error during scraping: {e}")
+        except Exception:
+            logger.exception("Error during scraping")
         finally:
+            await self._http.aclose()
             await self.quit()
 
     async def extract_article_urls(self) -> list[str]:
@@ -83,84 +84,90 @@ class FullfactFactcheckScraper(BaseScraper):
 
         return urls
 
-    async def extract_title(self, throw_error=True) -> str:
-        return (await self.page.locator("h1.mb-3.highlight-js").inner_text()).strip()
+    # All scalar fields in one in-browser pass: a single CDP round-trip
+    # replaces four separate locator calls on the fallback path
+    EXTRACT_FIELDS_JS = """() => ({
+        title: document.querySelector("h1.mb-3.highlight-js")?.innerText.trim(),
+        publish_date: document.querySelector("div.timestamp")?.innerText.trim(),
+        content: [...document.querySelectorAll("div.cms-content > div.block-rich_text")]
+            .map(e => e.innerText.trim())
+            .filter(Boolean)
+            .join("\\n\\n"),
+        authors: [...document.querySelectorAll("ul.citation > li > span > cite")]
+            .map(e => e.innerText.trim()),
+    })"""
+
+    async def extract_fields(self, page: Page) -> dict:
+        extracted = await page.evaluate(self.EXTRACT_FIELDS_JS)
+
+        if extracted["title"] is None or extracted["publish_date"] is None:
+            raise Exception("Missing title or publish date")
+
+        return extracted
+
+    # Claim/verdict pairs in one in-browser pass; the old per-card loop
+    # cost four round-trips (two count, two inner_text) per card
+    EXTRACT_CLAIMS_JS = """() => [...document.querySelectorAll(
+        "div.block-checked_claims div.card-claim-conclusion"
+    )].map(card => {
+        const claim = card.querySelector("div.card-claim-body p.card-text");
+        const verdict = card.querySelector("div.card-conclusion-body p.card-text");
+        return (claim && verdict)
+            ? [claim.innerText.trim(), verdict.innerText.trim()]
+            : null;
+    }).filter(Boolean)"""
 
     async def extract_claims_and_verdicts(
-        self, throw_error=True
+        self, page: Page, throw_error=True
     ) -> list[tuple[str, str]]:
-        pairs: list[tuple[str, str]] = []
-
-        cards = await self.page.locator(
-            "div.block-checked_claims div.card-claim-conclusion"
-        ).all()
+        return await page.evaluate(self.EXTRACT_CLAIMS_JS)
 
-        for card in cards:
-            claim_el = card.locator("div.card-claim-body p.card-text")
-            verdict_el = card.locator("div.card-conclusion-body p.card-text")
-
-            claim = (
-                (await claim_el.inner_text()).strip()
-                if await claim_el.count()
-                else None
-            )
-            verdict = (
-                (await verdict_el.inner_text()).strip()
-                if await verdict_el.count()
-                else None
-            )
+    def _extract_from_tree(self, tree: HTMLParser) -> dict | None:
+        """Extract article fields from a statically fetched page.
 
-            if claim and verdict:
-                pairs.append((claim, verdict))
+        Returns None when the key selectors are missing, which signals
+        the caller to retry on a rendered page.
+        """
+        title_el = tree.css_first("h1.mb-3.highlight-js")
+        date_el = tree.css_first("div.timestamp")
 
-        return pairs
-
-    async def extract_publish_date(self, throw_error=True) -> str:
-        return (await self.page.locator("div.timestamp").first.inner_text()).strip()
-
-    async def extract_content(self, throw_error=True) -> str:
-        # Get all paragraphs that come before the HR separator
-        content_paragraphs = await self.page.locator(
-            "div.cms-content > div.block-rich_text"
-        ).all_inner_texts()
-
-        # Filter out empty paragraphs and join
-        filtered_content = [text.strip() for text in content_paragraphs if text.strip()]
-
-        return "\n\n".join(filtered_content)
-
-    async def extract_authors(self, throw_error=True) -> list[str]:
-        try:
-            author_elements = await self.page.locator(
-                "ul.citation > li > span > cite"
-            ).all()
-            authors = []
-
-            for author_el in author_elements:
-                authors.append(await author_el.inner_text())
-
-            return authors
-        except Exception as e:
-            return []
-
-    async def extract_data_from_url(self, url: str) -> list[RawData]:
-        print(f"Scraping {url}")
+        if title_el is None or date_el is None:
+            return None
 
-        if not await self.navigate_with_retry(url):
-            await self.append_to_retry(url)
-            return []
-
-        try:
-            title = await self.extract_title()
-            publish_date = await self.extract_publish_date()
-            content = await self.extract_content()
-            authors = await self.extract_authors()
+        pairs: list[tuple[str, str]] = []
+        for card in tree.css("div.block-checked_claims div.card-claim-conclusion"):
+            claim_el = card.css_first("div.card-claim-body p.card-text")
+            verdict_el = card.css_first("div.card-conclusion-body p.card-text")
 
-            claims_and_verdicts = await self.extract_claims_and_verdicts()
-        except:
-            await self.append_to_retry(url, traceback.format_exc())
-            return []
+            if claim_el is not None and verdict_el is not None:
+                pairs.append(
+                    (claim_el.text().strip(), verdict_el.text().strip())
+                )
 
+        return {
+            "title": title_el.text().strip(),
+            "publish_date": date_el.text().strip(),
+            "content": "\n\n".join(
+                block.text().strip()
+                for block in tree.css("div.cms-content > div.block-rich_text")
+                if block.text().strip()
+            ),
+            "authors": [
+                cite.text().strip()
+                for cite in tree.css("ul.citation > li > span > cite")
+            ],
+            "claims_and_verdicts": pairs,
+        }
+
+    def _build_outputs(
+        self,
+        url: str,
+        title: str,
+        publish_date,
+        content: str,
+        authors: list[str],
+        claims_and_verdicts: list[tuple[str, str]],
+    ) -> list[RawData]:
         if len(claims_and_verdicts) == 0:
             return [
                 RawData(
@@ -177,10 +184,8 @@ class FullfactFactcheckScraper(BaseScraper):
                 )
             ]
 
-        outputs: list[RawData] = []
-
-        for cv in claims_and_verdicts:
-            article_data = RawData(
+        return [
+            RawData(
                 title=title,
                 content=content,
                 publish_date=publish_date,
@@ -192,10 +197,46 @@ class FullfactFactcheckScraper(BaseScraper):
                 verdict=cv[1],
                 authors=authors,
             )
+            for cv in claims_and_verdicts
+        ]
+
+    async def extract_data_from_url(self, url: str, page: Page) -> list[RawData]:
+        print(f"Scraping {url}")
+
+        # Fast path: plain HTTP fetch + selectolax
+        tree = await fetch_html(url, self._http)
+        extracted = self._extract_from_tree(tree) if tree is not None else None
+
+        if extracted is not None:
+            return self._build_outputs(
+                url,
+                extracted["title"],
+                extracted["publish_date"],
+                extracted["content"],
+                extracted["authors"],
+                extracted["claims_and_verdicts"],
+            )
 
-            outputs.append(article_data)
+        # Fallback: rendered page via Playwright
+        if not await self.navigate_with_retry(url, page=page):
+            await self.append_to_retry(url)
+            return []
 
-        return outputs
+        try:
+            extracted = await self.extract_fields(page)
+            claims_and_verdicts = await self.extract_claims_and_verdicts(page)
+        except:
+            await self.append_to_retry(url, traceback.format_exc())
+            return []
+
+        return self._build_outputs(
+            url,
+            extracted["title"],
+            extracted["publish_date"],
+            extracted["content"],
+            extracted["authors"],
+            claims_and_verdicts,
+        )
 
 
 async def main():
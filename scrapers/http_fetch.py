@@ -0,0 +1,27 @@
+from selectolax.parser import HTMLParser
+import httpx
+
+
+def make_client() -> httpx.AsyncClient:
+    """Shared HTTP client settings for the static-page fast path"""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=30,
+        follow_redirects=True,
+    )
+
+
+async def fetch_html(url: str, client: httpx.AsyncClient) -> HTMLParser | None:
+    """Fetch a static page and return a parsed selectolax tree.
+
+    Returns None when the page cannot be fetched; callers fall back to
+    their Playwright path in that case.
+    """
+    try:
+        response = await client.get(url)
+        response.raise_for_status()
+    except Exception:
+        return None
+
+    return HTMLParser(response.text)
@@ -0,0 +1,30 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+
+# Records are queued and formatted on a background listener thread, so
+# a burst of tracebacks never stalls the scraping event loop
+_log_queue: queue.Queue = queue.Queue()
+_listener: logging.handlers.QueueListener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return a logger that hands records to the background listener"""
+    global _listener
+
+    if _listener is None:
+        handler = logging.StreamHandler()
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+        )
+
+        _listener = logging.handlers.QueueListener(_log_queue, handler)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+        root = logging.getLogger("scrapers")
+        root.setLevel(logging.INFO)
+        root.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+    return logging.getLogger(name)
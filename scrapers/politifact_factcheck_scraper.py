@@ -1,20 +1,40 @@
 from .base import BaseScraper
-from playwright.async_api import Locator
+from .log import get_logger
+from .http_fetch import make_client, fetch_html
+from .ratelimit import HostRateLimiter
+from playwright.async_api import Page
+from selectolax.parser import HTMLParser
 from data_class.raw_data import RawData
-from dataclasses import asdict
+from urllib.parse import urljoin
 import asyncio
 import traceback
 
 
+logger = get_logger(__name__)
+
+
 class PolitifactScraper(BaseScraper):
+    # Selectors are fixed per site; keep the literals at class scope so
+    # the per-article extract calls never rebuild them inline
+    TITLE_SEL = '//*[@id="top"]/main/section[3]/div/article/div[2]/div/div[1]/div'
+    STATEMENT_META_SEL = "div.m-statement__meta"
+    STATEMENT_DESC_SEL = "div.m-statement__desc"
+    STATEMENT_METER_SEL = "div.m-statement__meter"
+    VERDICT_IMG_SEL = "div.c-image > picture > img.c-image__original"
+    CONTENT_SEL = ".t-row:has(article.m-textblock) div.t-row__center"
+    LISTING_SEL = "div.m-statement__quote > a"
+
     def __init__(self, start_page: int = 660):
         super().__init__(
             output_filename="politifact-factcheck",
             retry_filename="politifact-factcheck-retry",
         )
         self.start_page = start_page
-        self.restart_interval = 2  # In pages
-        self.log_clear_interval = 1  # In pages
+        self.listing_batch_size = 4  # Listing pages fetched concurrently
+        self.rate_limiter = HostRateLimiter(min_interval=1)  # Politer pace
+
+        # Listing pages are static; fetch them over plain HTTP
+        self._http = make_client()
 
     async def process(self) -> None:
         await self.start()
@@ -24,116 +44,127 @@ class PolitifactScraper(BaseScraper):
 
         try:
             while True:
-                if (
-                    curr_page % self.restart_interval == 0
-                    and curr_page != self.start_page
-                ):
+                if curr_page != self.start_page:
                     print(
-                        f"Restarting browser at page {curr_page} for memory management"
+                        f"Recycling browser contexts at page {curr_page} for memory management"
+                    )
+                    await self.recycle_context()
+
+                # Listing pages are independent indexes; fetch a batch of
+                # them concurrently instead of one per article batch
+                url_lists = await asyncio.gather(
+                    *(
+                        self.extract_urls(page_number)
+                        for page_number in range(
+                            curr_page, curr_page + self.listing_batch_size
+                        )
                     )
-                    await self.restart()
-
-                # print(f"Navigating to page {curr_page}")
-                await self.navigate_with_retry(
-                    f"https://www.politifact.com/factchecks/list/?page={curr_page}"
                 )
 
-                # print("Locating article contents")
-                articles = await self.locate_articles()
+                # None marks a failed fetch (logged and skipped); only a
+                # successfully fetched empty listing means the end of the
+                # index was reached
+                for page_number, url_list in zip(
+                    range(curr_page, curr_page + self.listing_batch_size), url_lists
+                ):
+                    if url_list is None:
+                        logger.warning("Skipping listing page %d - fetch failed", page_number)
 
-                if len(articles) == 0:
-                    print("No more articles found - scraping complete")
-                    break
+                urls = [
+                    url
+                    for url_list in url_lists
+                    if url_list is not None
+                    for url in url_list
+                ]
 
-                # print("Extracting URLs from articles")
-                urls = await self.extract_urls(articles)
+                if urls:
+                    # print("Scraping through article URLs")
+                    await self.scrape_urls(urls)
 
-                if len(urls) == 0:
-                    print("No URLs extracted - may have reached the end")
+                if any(url_list == [] for url_list in url_lists):
+                    print("No more articles found - scraping complete")
                     break
 
-                # print("Scraping through article URLs")
-                for url in urls:
-                    article_data = await self.extract_data_from_url(url)
-
-                    if article_data == None:
-                        continue
-
-                    article_data_dict = asdict(article_data)
-
-                    await self.append_to_json(article_data_dict)
-
-                    await asyncio.sleep(1)
-
-                curr_page += 1
+                curr_page += self.listing_batch_size
                 await self.clear_logs_and_gc()
 
-        except Exception as e:
-            print(traceback.format_exc())
-            print(f"Error during scraping: {e}")
+        except Exception:
+            logger.exception("Error during scraping")
         finally:
+            await self._http.aclose()
             await self.quit()
 
-    async def locate_articles(self) -> list[Locator]:
-        return await self.page.locator("div.m-statement__quote > a").all()
-
-    async def extract_urls(self, articles: list[Locator]) -> list[str]:
-        urls: list[str] = []
+    async def _fetch_listing_with_retry(
+        self, url: str, max_retries: int = 3
+    ) -> HTMLParser | None:
+        """fetch_html with exponential backoff on failure; listings have
+        no Playwright fallback to absorb a transient error"""
+        for attempt in range(max_retries):
+            await self.rate_limiter.acquire(url)
+            tree = await fetch_html(url, self._http)
+            if tree is not None:
+                return tree
+
+            logger.warning(
+                "Attempt %d/%d failed for listing %s", attempt + 1, max_retries, url
+            )
+            if attempt < max_retries - 1:
+                await asyncio.sleep(2**attempt)
+        return None
+
+    async def extract_urls(self, page_number: int) -> list[str] | None:
+        """Fetch the listing page over plain HTTP and collect all hrefs
+        in one selectolax pass instead of per-anchor CDP round-trips.
+
+        Returns None when the fetch fails, so a dead listing page is not
+        mistaken for the end of the index."""
+        tree = await self._fetch_listing_with_retry(
+            f"https://www.politifact.com/factchecks/list/?page={page_number}"
+        )
 
-        for article in articles:
-            href = await article.get_attribute("href")
-            if href:
-                # Handle relative URLs
-                if href.startswith("/"):
-                    href = f"https://www.politifact.com{href}"
-                urls.append(href)
+        if tree is None:
+            return None
 
-        return urls
+        return [
+            urljoin("https://www.politifact.com", a.attributes.get("href"))
+            for a in tree.css(self.LISTING_SEL)
+            if a.attributes.get("href")
+        ]
 
-    async def extract_title(self, throw_error=True) -> str:
-        return (
-            await self.page.locator(
-                '//*[@id="top"]/main/section[3]/div/article/div[2]/div/div[1]/div'
-            ).inner_text()
-        ).strip()
+    async def extract_title(self, page: Page, throw_error=True) -> str:
+        return (await page.locator(self.TITLE_SEL).inner_text()).strip()
 
-    async def extract_publish_date(self, throw_error=True) -> str:
+    async def extract_publish_date(self, page: Page, throw_error=True) -> str:
+        statement_meta = page.locator(self.STATEMENT_META_SEL).nth(1)
         return (
-            await self.page.locator("div.m-statement__meta")
-            .nth(1)
-            .locator("div.m-statement__desc")
-            .inner_text()
+            await statement_meta.locator(self.STATEMENT_DESC_SEL).inner_text()
         ).strip()
 
-    async def extract_verdict(self, throw_error=True) -> str:
+    async def extract_verdict(self, page: Page, throw_error=True) -> str:
+        statement_meter = page.locator(self.STATEMENT_METER_SEL).nth(1)
         return (
-            await self.page.locator("div.m-statement__meter")
-            .nth(1)
-            .locator("div.c-image > picture > img.c-image__original")
-            .get_attribute("alt")
+            await statement_meter.locator(self.VERDICT_IMG_SEL).get_attribute("alt")
         ).strip()
 
-    async def extract_content(self, throw_error=True) -> str:
-        content_element = self.page.locator(
-            ".t-row:has(article.m-textblock) div.t-row__center"
-        )
+    async def extract_content(self, page: Page, throw_error=True) -> str:
+        content_element = page.locator(self.CONTENT_SEL)
         content_text = await content_element.all_inner_texts()
 
         return "\n\n".join(content_text)
 
-    async def extract_data_from_url(self, url: str) -> RawData | int:
+    async def extract_data_from_url(self, url: str, page: Page) -> RawData | None:
         print(f"Scraping {url}")
 
-        if not await self.navigate_with_retry(url):
+        if not await self.navigate_with_retry(url, page=page):
             await self.append_to_retry(url)
             return None
 
         try:
-            title = await self.extract_title()
-            publish_date = await self.extract_publish_date()
+            title = await self.extract_title(page)
+            publish_date = await self.extract_publish_date(page)
             claim = title
-            verdict = await self.extract_verdict()
-            content = await self.extract_content()
+            verdict = await self.extract_verdict(page)
+            content = await self.extract_content(page)
         except Exception as e:
             await self.append_to_retry(url, traceback.format_exc())
             return None
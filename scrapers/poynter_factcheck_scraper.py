@@ -1,128 +1,163 @@
 from .base import BaseScraper
-from playwright.async_api import Locator
+from .log import get_logger
+from .http_fetch import make_client, fetch_html
+from playwright.async_api import Locator, Page
+from selectolax.parser import HTMLParser
 from data_class.raw_data import RawData
-from dataclasses import asdict
 import asyncio
+import aiofiles
 import traceback
 import csv
 from pathlib import Path
+from typing import AsyncIterator
+
+
+logger = get_logger(__name__)
 
 
 class PoynterFactcheckScraper(BaseScraper):
-    def __init__(self, csv_file: str, start_index: int = 1):
+    # Selectors shared by the static fast path and the Playwright fallback
+    TITLE_SEL = "h1.article-header__headline.headline_1"
+    DATE_SEL = "div.poynter-blog-date"
+    CONTENT_SEL = "div.poynter-post-content p"
+    AUTHORS_SEL = "div.poynter-blog-author.author-info-content__name > a"
+
+    def __init__(self, csv_file: str | None = None, start_index: int = 1):
         super().__init__(
             output_filename="poynter-factcheck",
             retry_filename="poynter-factcheck-retry",
         )
-        self.csv_file = Path(csv_file)
+        self.csv_file = Path(csv_file) if csv_file else None
         self.start_index = start_index
         self.restart_interval = 15
         self.log_clear_interval = 15
 
-    def read_urls_from_csv(self) -> list[str]:
-        """Read URLs from CSV file starting from start_index"""
-        urls = []
+        # Poynter articles are server-rendered; try a plain HTTP fetch
+        # first and only fall back to the browser when selectors miss
+        self._http = make_client()
+
+    async def iter_urls_from_csv(self) -> AsyncIterator[str]:
+        """Stream URLs from the CSV lazily, starting from start_index.
+
+        aiofiles keeps file I/O off the event loop and the generator
+        avoids materializing the whole URL list up front.
+        """
         try:
-            with open(self.csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                for row in reader:
-                    # Get the ID and URL from each row
-                    article_id = int(row['id'])
-                    article_url = row['url']
-                    
+            async with aiofiles.open(self.csv_file, "r", encoding="utf-8") as f:
+                header_skipped = False
+
+                async for line in f:
+                    if not header_skipped:
+                        header_skipped = True
+                        continue
+
+                    if not line.strip():
+                        continue
+
+                    # Each row is "id,url"
+                    row = next(csv.reader([line]))
+
                     # Only include URLs from start_index onwards
-                    if article_id >= self.start_index:
-                        urls.append(article_url)
-                        
-            print(f"Loaded {len(urls)} URLs from CSV (starting from ID {self.start_index})")
-            return urls
-            
-        except Exception as e:
-            print(f"Error reading CSV file: {e}")
-            return []
+                    if int(row[0]) >= self.start_index:
+                        yield row[1]
 
-    async def process(self) -> None:
-        await self.start()
+        except Exception:
+            logger.exception("Error reading CSV file")
+
+    async def fetch_urls_from_api(self) -> list[str]:
+        """Pull article URLs straight from Poynter's WordPress REST API
+        instead of pre-scraping rendered listing pages into a CSV"""
+        urls: list[str] = []
+        page_number = 1
+
+        while True:
+            response = await self._http.get(
+                "https://www.poynter.org/wp-json/wp/v2/posts",
+                params={"page": page_number, "per_page": 50, "_fields": "link"},
+            )
+
+            # WordPress answers 400 once page is past the last one
+            if response.status_code == 400:
+                break
+            response.raise_for_status()
+
+            batch = response.json()
+            if not batch:
+                break
 
-        # Read URLs from CSV
-        urls = self.read_urls_from_csv()
-        
-        if not urls:
-            print("No URLs found in CSV file")
-            return
+            urls.extend(item["link"] for item in batch if item.get("link"))
+            page_number += 1
 
-        # Track current index for restart intervals
-        curr_index = self.start_index
+        print(f"Loaded {len(urls)} URLs from the WordPress API")
+        return urls
+
+    async def _iter_urls(self) -> AsyncIterator[str]:
+        """Stream from the CSV if one was given, otherwise hit the API"""
+        if self.csv_file:
+            async for url in self.iter_urls_from_csv():
+                yield url
+        else:
+            for url in await self.fetch_urls_from_api():
+                yield url
+
+    async def process(self) -> None:
+        await self.start()
 
         try:
-            print(f"Starting to scrape {len(urls)} articles...")
-            
-            for i, url in enumerate(urls):
-                # Restart browser periodically for memory management
-                if (curr_index % self.restart_interval == 0 and curr_index != self.start_index):
-                    print(f"Restarting browser at article {curr_index} for memory management")
-                    await self.restart()
-                    await self.clear_logs_and_gc()
+            print("Starting to scrape articles...")
 
-                # Extract data from current URL
-                article_data = await self.extract_data_from_url(url)
+            # Scrape concurrently in batches of restart_interval URLs,
+            # recycling browser contexts between batches for memory
+            processed = 0
+            batch: list[str] = []
 
-                if article_data is None:
-                    curr_index += 1
+            async for url in self._iter_urls():
+                batch.append(url)
+
+                if len(batch) < self.restart_interval:
                     continue
 
-                # Save to JSON
-                article_data_dict = asdict(article_data)
-                await self.append_to_json(article_data_dict)
-
-                # Small delay between requests
-                await asyncio.sleep(0.5)
-                
-                curr_index += 1
-                
-                # Progress update
-                if curr_index % 5 == 0:
-                    print(f"Progress: {curr_index - self.start_index + 1}/{len(urls)} articles processed")
-
-                # Clear logs periodically
-                if curr_index % self.log_clear_interval == 0:
+                if processed > 0:
+                    await self.recycle_context()
                     await self.clear_logs_and_gc()
 
-            print(f"Completed scraping {len(urls)} articles")
+                await self.scrape_urls(batch)
+                processed += len(batch)
+                batch = []
 
-        except Exception as e:
-            print(traceback.format_exc())
-            print(f"Error during scraping: {e}")
+                print(f"Progress: {processed} articles processed")
+
+            # Trailing partial batch
+            if batch:
+                await self.scrape_urls(batch)
+                processed += len(batch)
+
+            print(f"Completed scraping {processed} articles")
+
+        except Exception:
+            logger.exception("Error during scraping")
         finally:
+            await self._http.aclose()
             await self.quit()
 
-    async def extract_title(self, throw_error=True) -> str:
-        return (
-            await self.page.locator(
-                "h1.article-header__headline.headline_1"
-            ).inner_text()
-        ).strip()
+    async def extract_title(self, page: Page, throw_error=True) -> str:
+        return (await page.locator(self.TITLE_SEL).inner_text()).strip()
 
-    async def extract_publish_date(self, throw_error=True) -> str:
-        return (await self.page.locator("div.poynter-blog-date").inner_text()).strip()
+    async def extract_publish_date(self, page: Page, throw_error=True) -> str:
+        return (await page.locator(self.DATE_SEL).inner_text()).strip()
 
-    async def extract_content(self, throw_error=True) -> str:
+    async def extract_content(self, page: Page, throw_error=True) -> str:
         # Get all paragraphs from the content div
-        content_paragraphs = await self.page.locator(
-            "div.poynter-post-content p"
-        ).all_inner_texts()
+        content_paragraphs = await page.locator(self.CONTENT_SEL).all_inner_texts()
 
         # Filter out empty paragraphs and join
         filtered_content = [text.strip() for text in content_paragraphs if text.strip()]
 
         return "\n\n".join(filtered_content)
 
-    async def extract_authors(self, throw_error=True) -> list[str]:
+    async def extract_authors(self, page: Page, throw_error=True) -> list[str]:
         try:
-            author_elements = await self.page.locator(
-                "div.poynter-blog-author.author-info-content__name > a"
-            ).all()
+            author_elements = await page.locator(self.AUTHORS_SEL).all()
             authors = []
 
             for author_el in author_elements:
@@ -132,18 +167,62 @@ class PoynterFactcheckScraper(BaseScraper):
         except Exception as e:
             return []
 
-    async def extract_data_from_url(self, url: str) -> RawData | None:
+    def _extract_from_tree(self, tree: HTMLParser) -> dict | None:
+        """Extract article fields from a statically fetched page.
+
+        Returns None when the key selectors are missing, which signals
+        the caller to retry on a rendered page.
+        """
+        title_el = tree.css_first(self.TITLE_SEL)
+        date_el = tree.css_first(self.DATE_SEL)
+
+        if title_el is None or date_el is None:
+            return None
+
+        return {
+            "title": title_el.text().strip(),
+            "publish_date": date_el.text().strip(),
+            "content": "\n\n".join(
+                p.text().strip()
+                for p in tree.css(self.CONTENT_SEL)
+                if p.text().strip()
+            ),
+            "authors": [
+                a.text().strip() for a in tree.css(self.AUTHORS_SEL)
+            ],
+        }
+
+    async def extract_data_from_url(self, url: str, page: Page) -> RawData | None:
         print(f"Scraping: {url}")
 
-        if not await self.navigate_with_retry(url):
+        # Fast path: plain HTTP fetch + selectolax
+        tree = await fetch_html(url, self._http)
+        extracted = self._extract_from_tree(tree) if tree is not None else None
+
+        if extracted is not None:
+            return RawData(
+                title=extracted["title"],
+                content=extracted["content"],
+                publish_date=extracted["publish_date"],
+                url=url,
+                source="poynter",
+                type="fact-check-no-verdict",
+                source_bias=None,
+                claim=extracted["title"],
+                verdict=None,
+                authors=extracted["authors"],
+            )
+
+        # Fallback: rendered page via Playwright
+        if not await self.navigate_with_retry(url, page=page):
             await self.append_to_retry(url)
             return None
 
         try:
-            title = await self.extract_title()
-            publish_date = await self.extract_publish_date()
-            content = await self.extract_content()
-            authors = await self.extract_authors()
+            title = await self.extract_title(page)
+            publish_date = await self.extract_publish_date(page)
+            content = await self.extract_content(page)
+            authors = await self.extract_authors(page)
         except Exception as e:
             await self.append_to_retry(url, traceback.format_exc())
             return None
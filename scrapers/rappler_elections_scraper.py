@@ -1,10 +1,13 @@
 from .base import BaseScraper
-from playwright.async_api import Locator
+from .log import get_logger
+from .ratelimit import HostRateLimiter
+from playwright.async_api import Locator, Page
 from data_class.raw_data import RawData
-from dataclasses import asdict
 import asyncio
 import traceback
-from datetime import datetime
+
+
+logger = get_logger(__name__)
 
 
 class RapplerElectionsScraper(BaseScraper):
@@ -16,6 +19,7 @@ class RapplerElectionsScraper(BaseScraper):
         self.start_page = start_page
         self.restart_interval = 50  # In pages
         self.log_clear_interval = 5  # In pages
+        self.rate_limiter = HostRateLimiter(min_interval=1)  # Politer pace
 
     async def process(self) -> None:
         await self.start()
@@ -30,9 +34,9 @@ class RapplerElectionsScraper(BaseScraper):
                     and curr_page != self.start_page
                 ):
                     print(
-                        f"Restarting browser at page {curr_page} for memory management"
+                        f"Recycling browser contexts at page {curr_page} for memory management"
                     )
-                    await self.restart()
+                    await self.recycle_context()
 
                 if (
                     curr_page % self.log_clear_interval == 0
@@ -53,23 +57,12 @@ class RapplerElectionsScraper(BaseScraper):
                     break
 
                 # print("Scraping through article URLs")
-                for url in urls:
-                    article_data = await self.extract_data_from_url(url)
-
-                    if article_data == None:
-                        continue
-
-                    article_data_dict = asdict(article_data)
-
-                    await self.append_to_json(article_data_dict)
-
-                    await asyncio.sleep(1)
+                await self.scrape_urls(urls)
 
                 curr_page += 1
 
-        except Exception as e:
-            print(traceback.format_exc())
-            print(f"Error during scraping: {e}")
+        except Exception:
+            logger.exception("Error during scraping")
         finally:
             await self.quit()
 
@@ -88,60 +81,55 @@ class RapplerElectionsScraper(BaseScraper):
 
         return urls
 
-    async def extract_title(self, throw_error=True) -> str:
-        return (await self.page.locator("h1.post-single__title").inner_text()).strip()
+    async def extract_title(self, page: Page, throw_error=True) -> str:
+        return (await page.locator("h1.post-single__title").inner_text()).strip()
 
-    async def extract_publish_date(self, throw_error=True) -> datetime:
-        return datetime.fromisoformat(
-            await self.page.locator("span.posted-on > time").get_attribute("datetime")
+    async def extract_publish_date(self, page: Page, throw_error=True) -> str:
+        # The datetime attribute is already ISO-8601; pass it through
+        # rather than parsing and re-serializing it
+        publish_date = await page.locator("span.posted-on > time").get_attribute(
+            "datetime"
         )
-
-    async def extract_content(self, throw_error=True) -> str:
-        # Remove ad containers
-        await self.page.locator("div.rappler-ad-container").evaluate_all(
-            "elements => elements.forEach(el => el.remove())"
+        if publish_date is None:
+            raise Exception("Missing publish date")
+        return publish_date
+
+    async def extract_content(self, page: Page, throw_error=True) -> str:
+        # Filter ad containers and join the text in a single evaluate
+        # call instead of mutating the DOM and then pulling every
+        # element's text over its own round-trip
+        return await page.evaluate(
+            """() => [...document.querySelectorAll(
+                "div.post-single__content.entry-content > *"
+            )]
+                .filter(e => !e.matches(".rappler-ad-container, .rappler-ad-container *"))
+                .map(e => e.innerText.trim())
+                .filter(Boolean)
+                .join("\\n\\n")"""
         )
 
-        # Extract remaining content
-        content_elements = await self.page.locator(
-            "div.post-single__content.entry-content > *"
-        ).all()
-
-        content_parts = []
-        for element in content_elements:
-            text = await element.inner_text()
-            if text.strip():
-                content_parts.append(text.strip())
-
-        return "\n\n".join(content_parts)
-
-    async def extract_authors(self, throw_error=True) -> list[str]:
-        try:
-            authors: list[str] = list(
-                map(
-                    str.strip,
-                    (
-                        await self.page.locator("div.post-single__authors").inner_text()
-                    ).split(","),
-                )
-            )
-        except Exception as e:
-            return []
-
-        return authors
+    async def extract_authors(self, page: Page, throw_error=True) -> list[str]:
+        # Split in the page so authors arrive pre-structured; errors
+        # surface through extract_data_from_url's handler
+        return await page.evaluate(
+            """() => (document.querySelector("div.post-single__authors")?.innerText || "")
+                .split(",")
+                .map(s => s.trim())
+                .filter(Boolean)"""
+        )
 
-    async def extract_data_from_url(self, url: str) -> RawData | int:
+    async def extract_data_from_url(self, url: str, page: Page) -> RawData | None:
         print(f"Scraping {url}")
 
-        if not await self.navigate_with_retry(url):
+        if not await self.navigate_with_retry(url, page=page):
             await self.append_to_retry(url)
             return None
 
         try:
-            title = await self.extract_title()
-            publish_date = await self.extract_publish_date()
-            content = await self.extract_content()
-            authors = await self.extract_authors()
+            title = await self.extract_title(page)
+            publish_date = await self.extract_publish_date(page)
+            content = await self.extract_content(page)
+            authors = await self.extract_authors(page)
         except Exception as e:
             await self.append_to_retry(url, traceback.format_exc())
             return None
@@ -149,7 +137,7 @@ class RapplerElectionsScraper(BaseScraper):
         article_data = RawData(
             title=title,
             content=content,
-            publish_date=publish_date.isoformat(),
+            publish_date=publish_date,
             url=url,
             source="rappler",
             type="elections",
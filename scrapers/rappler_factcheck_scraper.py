@@ -1,13 +1,27 @@
 from .base import BaseScraper
-from playwright.async_api import Locator
+from .log import get_logger
+from playwright.async_api import Page
 from data_class.raw_data import RawData
-from datetime import datetime
-from dataclasses import asdict
 import asyncio
 import traceback
 
 
+logger = get_logger(__name__)
+
+
 class RapplerScraper(BaseScraper):
+    # Claim/verdict phrasing variants, probed in priority order by the
+    # fused evaluate; kept at class scope like the other scrapers'
+    # selector constants so they are built once
+    CLAIM_PREFIXES = [
+        "Claim:",
+        "The claim:",
+        "Ang sabi-sabi:",
+        "CLAIM:",
+        "ANG SABI-SABI:",
+    ]
+    VERDICT_PREFIXES = ["Rating:", "Marka:"]
+
     def __init__(self):
         super().__init__(
             output_filename="rappler-factcheck",
@@ -27,139 +41,98 @@ class RapplerScraper(BaseScraper):
                     f"https://www.rappler.com/newsbreak/fact-check/page/{curr_page}"
                 )
 
-                print("Locating article contents")
-                articles = await self.locate_articles()
-
                 print("Extracting URLs from articles")
-                urls = await self.extract_urls(articles)
+                urls = await self.extract_urls()
 
                 print("Scraping through article URLs")
-                for url in urls:
-                    article_data = await self.extract_data_from_url(url)
-
-                    if article_data == None:
-                        continue
-
-                    article_data_dict = asdict(article_data)
-
-                    await self.append_to_json(article_data_dict)
-
-                    await asyncio.sleep(2)
+                await self.scrape_urls(urls)
 
                 curr_page += 1
 
-        except Exception as e:
-            print(traceback.format_exc())
-            print(f"Error during scraping: {e}")
+        except Exception:
+            logger.exception("Error during scraping")
         finally:
             await self.quit()
 
-    async def locate_articles(self) -> list[Locator]:
-        return await self.page.locator("div.archive-article__content > h2 > a").all()
-
-    async def extract_urls(self, articles: list[Locator]) -> list[str]:
-        urls: list[str] = []
-
-        for article in articles:
-            href = await article.get_attribute("href")
-            if href:
-                # Handle relative URLs
-                if href.startswith("/"):
-                    href = f"https://www.rappler.com{href}"
-                urls.append(href)
-
-        return urls
-
-    async def extract_title(self, throw_error=True) -> str:
-        return (await self.page.locator("h1.post-single__title").inner_text()).strip()
-
-    async def extract_publish_date(self, throw_error=True) -> datetime:
-        return datetime.fromisoformat(
-            await self.page.locator("span.posted-on > time").get_attribute("datetime")
-        )
-
-    async def extract_claim(self, throw_error=True) -> str:
-        english_selector = self.page.locator(
-            "div.entry-content p:has-text('Claim:'), li:has(strong:text('Claim:')), h5:has-text('Claim:')"
-        )
-        if await english_selector.count() > 0:
-            claim_full_text = await english_selector.inner_text()
-            return claim_full_text.strip().removeprefix("Claim: ")
-
-        p2_selector = self.page.locator("div.entry-content p:has-text('The claim:')")
-        if await p2_selector.count() > 0:
-            claim_full_text = await p2_selector.inner_text()
-            return claim_full_text.strip().removeprefix("The claim: ")
-
-        tagalog_selector = self.page.locator(
-            "div.entry-content p:has-text('Ang sabi-sabi:'), li:has(strong:text('Ang sabi-sabi:'))"
-        )
-        if await tagalog_selector.count() > 0:
-            claim_full_text = await tagalog_selector.inner_text()
-            return claim_full_text.strip().removeprefix("Ang sabi-sabi: ")
-
-        english_caps_selector = self.page.locator("p:has-text('CLAIM:')")
-        if await english_caps_selector.count() > 0:
-            claim_full_text = await english_caps_selector.inner_text()
-            return claim_full_text.strip().removeprefix("CLAIM: ")
-
-        tagalog_caps_selector = self.page.locator("p:has-text('ANG SABI-SABI:')")
-        if await tagalog_caps_selector.count() > 0:
-            claim_full_text = await tagalog_caps_selector.inner_text()
-            return claim_full_text.strip().removeprefix("ANG SABI-SABI: ")
-
-        raise Exception("No claim element found")
-
-    async def extract_verdict(self, throw_error=True) -> str:
-        english_selector = self.page.locator(
-            "h5:has-text('Rating:'), p:has-text('Rating:'), li:has(strong:text('Rating:'))"
+    async def extract_urls(self) -> list[str]:
+        """Collect every listing href in one call; .href is already
+        absolute, so no relative-URL fixup is needed"""
+        return await self.page.eval_on_selector_all(
+            "div.archive-article__content > h2 > a",
+            "els => els.map(a => a.href).filter(Boolean)",
         )
-        if await english_selector.count() > 0:
-            rating_text = await english_selector.inner_text()
-            return rating_text.strip().removeprefix("Rating: ")
 
-        tagalog_selector = self.page.locator(
-            "h5:has-text('Marka:'), p:has-text('Marka:'), li:has(strong:text('Marka:'))"
+    # All fields in one in-browser pass: a single CDP round-trip
+    # replaces the five per-field extract calls. Claim and verdict are
+    # found by probing each phrasing variant in priority order.
+    EXTRACT_FIELDS_JS = """([claimPrefixes, verdictPrefixes]) => {
+        const firstPrefixed = (prefixes) => {
+            const candidates = document.querySelectorAll("p, li, h5");
+            for (const prefix of prefixes) {
+                for (const el of candidates) {
+                    const text = el.innerText.trim();
+                    if (text.startsWith(prefix)) {
+                        return text.slice(prefix.length).trim();
+                    }
+                }
+            }
+            return null;
+        };
+
+        return {
+            title: document.querySelector("h1.post-single__title")?.innerText.trim(),
+            publish_date: document.querySelector("span.posted-on > time")
+                ?.getAttribute("datetime"),
+            claim: firstPrefixed(claimPrefixes),
+            verdict: firstPrefixed(verdictPrefixes),
+            content: [...document.querySelectorAll(
+                "div.post-single__content.entry-content"
+            )]
+                .map(e => e.innerText.trim())
+                .filter(Boolean)
+                .join("\\n\\n"),
+        };
+    }"""
+
+    async def extract_fields(self, page: Page) -> dict:
+        extracted = await page.evaluate(
+            self.EXTRACT_FIELDS_JS,
+            [self.CLAIM_PREFIXES, self.VERDICT_PREFIXES],
         )
-        if await tagalog_selector.count() > 0:
-            rating_text = await tagalog_selector.inner_text()
-            return rating_text.strip().removeprefix("Marka: ")
 
-        raise Exception("No verdict element found")
+        if extracted["title"] is None or extracted["publish_date"] is None:
+            raise Exception("Missing title or publish date")
+        if extracted["claim"] is None:
+            raise Exception("No claim element found")
+        if extracted["verdict"] is None:
+            raise Exception("No verdict element found")
 
-    async def extract_content(self, throw_error=True) -> str:
-        parent_div = await self.page.locator(
-            "div.post-single__content.entry-content"
-        ).all_inner_texts()
-        return "\n\n".join(parent_div)
+        return extracted
 
-    async def extract_data_from_url(self, url: str) -> RawData | int:
+    async def extract_data_from_url(self, url: str, page: Page) -> RawData | None:
         print(f"Scraping {url}")
 
-        if not await self.navigate_with_retry(url):
+        if not await self.navigate_with_retry(url, page=page):
             await self.append_to_retry(url)
             return None
 
         try:
-            title = await self.extract_title()
-            publish_date = await self.extract_publish_date()
-            claim = await self.extract_claim()
-            verdict = await self.extract_verdict()
-            content = await self.extract_content()
+            extracted = await self.extract_fields(page)
         except Exception as e:
             await self.append_to_retry(url, traceback.format_exc())
             return None
 
         article_data = RawData(
-            title=title,
-            content=content,
-            publish_date=publish_date.isoformat(),
+            title=extracted["title"],
+            content=extracted["content"],
+            # The datetime attribute is already ISO-8601; store it as-is
+            publish_date=extracted["publish_date"],
             url=url,
             source="rappler",
             type="fact-check",
             source_bias=None,
-            claim=claim,
-            verdict=verdict,
+            claim=extracted["claim"],
+            verdict=extracted["verdict"],
             authors=[],
         )
 
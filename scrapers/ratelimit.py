@@ -0,0 +1,30 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+
+class HostRateLimiter:
+    """Per-host politeness limiter.
+
+    Requests to the same host are spaced at least min_interval seconds
+    apart; requests to different hosts proceed immediately. Unlike a
+    fixed per-article sleep, concurrent workers only wait when they
+    actually contend on the same host.
+    """
+
+    def __init__(self, min_interval: float = 0.5):
+        self.min_interval = min_interval
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._last_request: dict[str, float] = {}
+
+    async def acquire(self, url: str) -> None:
+        host = urlsplit(url).netloc
+        lock = self._locks.setdefault(host, asyncio.Lock())
+
+        async with lock:
+            wait = self.min_interval - (
+                time.monotonic() - self._last_request.get(host, 0.0)
+            )
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request[host] = time.monotonic()
@@ -1,8 +1,9 @@
-import requests
+import httpx
+import asyncio
+import orjson
 import csv
 from pathlib import Path
-import time
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 class WHONewsUrlFetcher:
@@ -23,23 +24,45 @@ class WHONewsUrlFetcher:
             "$skip": "0",
         }
 
-        self.all_urls = []
         self.total_fetched = 0
 
-    def fetch_news_batch(self, skip: int) -> List[Dict]:
-        """Fetch a batch of news items with the given skip offset"""
-        self.params["$skip"] = str(skip)
-
-        try:
-            response = requests.get(self.base_url, params=self.params, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-            return data.get("value", [])
-
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching data at skip={skip}: {e}")
-            return []
+        # Stream URLs straight to the CSV as batches arrive instead of
+        # accumulating the whole list in memory first
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        self._csv_fh = open(
+            self.output_file, "w", newline="", encoding="utf-8", buffering=1 << 20
+        )
+        self._writer = csv.writer(self._csv_fh)
+        self._writer.writerow(["id", "url"])
+
+    async def fetch_news_batch(
+        self, client: httpx.AsyncClient, skip: int, max_retries: int = 3
+    ) -> Optional[List[Dict]]:
+        """Fetch a batch of news items with the given skip offset.
+
+        Returns None when the fetch fails after retries, so a transient
+        error is never mistaken for an empty (end-of-data) batch.
+        """
+        # Copy the params per call; concurrent fetches share self.params
+        params = {**self.params, "$skip": str(skip)}
+
+        for attempt in range(max_retries):
+            try:
+                response = await client.get(self.base_url, params=params)
+                response.raise_for_status()
+
+                # orjson parses the raw bytes faster than response.json()
+                data = orjson.loads(response.content)
+                return data.get("value", [])
+
+            except httpx.HTTPError as e:
+                print(
+                    f"Attempt {attempt + 1}/{max_retries} failed at skip={skip}: {e}"
+                )
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(2**attempt)
+
+        return None
 
     def extract_urls_from_batch(self, batch: List[Dict]) -> List[str]:
         """Extract and format complete URLs from batch results"""
@@ -56,88 +79,87 @@ class WHONewsUrlFetcher:
 
         return urls
 
-    def fetch_all_urls(self) -> None:
+    async def fetch_all_urls(self) -> None:
         """Fetch all news URLs from WHO API"""
         print("Starting to fetch WHO news URLs...")
 
+        batch_size = 100
+        window = 16  # Speculative batches in flight at once
+        sem = asyncio.Semaphore(16)
         skip = 0
-        batch_num = 1
-
-        while True:
-            print(f"Fetching batch {batch_num} (skip={skip})...")
-
-            # Fetch batch
-            batch = self.fetch_news_batch(skip)
-
-            # Check if we've reached the end
-            if not batch or len(batch) == 0:
-                print(f"Reached the end of results at skip={skip}")
-                break
-
-            # Extract URLs from batch
-            urls = self.extract_urls_from_batch(batch)
-            self.all_urls.extend(urls)
-            self.total_fetched += len(urls)
-
-            print(f"Fetched {len(urls)} URLs (Total: {self.total_fetched})")
-
-            # Move to next batch
-            skip += 100
-            batch_num += 1
 
-            # Small delay to be respectful to the API
-            time.sleep(0.5)
+        async def fetch(client: httpx.AsyncClient, offset: int) -> List[Dict]:
+            async with sem:
+                return await self.fetch_news_batch(client, offset)
+
+        # HTTP/2 multiplexes the window of requests over a couple of
+        # kept-alive connections to the WHO CDN
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+        ) as client:
+            while True:
+                # The total count is unknown up front, so fire a window of
+                # speculative offsets concurrently and stop once any batch
+                # in the window comes back empty
+                batches = await asyncio.gather(
+                    *(
+                        fetch(client, skip + i * batch_size)
+                        for i in range(window)
+                    )
+                )
+
+                reached_end = False
+                for i, batch in enumerate(batches):
+                    if batch is None:
+                        # Failed fetch: skip this offset but keep the
+                        # already-fetched batches after it in the window
+                        print(
+                            f"Skipping batch at skip={skip + i * batch_size} - fetch failed"
+                        )
+                        continue
+
+                    if not batch:
+                        # A successfully fetched empty batch is the end
+                        reached_end = True
+                        break
+
+                    urls = self.extract_urls_from_batch(batch)
+                    self._writer.writerows(
+                        (self.total_fetched + i, url)
+                        for i, url in enumerate(urls, 1)
+                    )
+                    self.total_fetched += len(urls)
+
+                print(f"Fetched {self.total_fetched} URLs so far")
+
+                if reached_end:
+                    print(f"Reached the end of results")
+                    break
+
+                skip += window * batch_size
 
         print(f"\nCompleted! Total URLs fetched: {self.total_fetched}")
 
-    def save_to_csv(self) -> None:
-        """Save all URLs to CSV file"""
-        if not self.all_urls:
-            print("No URLs to save")
-            return
-
-        # Create output directory if it doesn't exist
-        self.output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        try:
-            with open(self.output_file, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-
-                # Write header
-                writer.writerow(["id", "url"])
-
-                # Write URLs with sequential IDs
-                for i, url in enumerate(self.all_urls, 1):
-                    writer.writerow([i, url])
-
-            print(f"Saved {len(self.all_urls)} URLs to {self.output_file}")
-
-        except Exception as e:
-            print(f"Error saving to CSV: {e}")
-
-    def process(self) -> None:
+    async def process(self) -> None:
         """Main processing method"""
-        # Fetch all URLs
-        self.fetch_all_urls()
-
-        # Save to CSV
-        self.save_to_csv()
+        try:
+            await self.fetch_all_urls()
+        finally:
+            self._csv_fh.close()
 
-        # Show sample URLs
-        if self.all_urls:
-            print("\nSample URLs (first 3):")
-            for i, url in enumerate(self.all_urls[:3], 1):
-                print(f"{i}. {url}")
+        print(f"Saved {self.total_fetched} URLs to {self.output_file}")
 
 
-def main():
+async def main():
     # Configure output path
     output_file = "outputs/who_news_urls.csv"
 
     # Create fetcher and run
     fetcher = WHONewsUrlFetcher(output_file)
-    fetcher.process()
+    await fetcher.process()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())